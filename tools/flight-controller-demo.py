@@ -8,69 +8,90 @@ Shows how the same framework can generate flight control systems instead of boos
 
 import sys
 import os
+import logging
 from pathlib import Path
+from typing import List
 
 # Add current directory for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from systematic_engineering_core import SystematicEngineeringFramework
 
+def flush_lines(lines: List[str]):
+    """Write buffered output lines in a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    lines.clear()
+
 def main():
     """Demonstrate framework with flight controller configuration"""
     
-    print("🚁 Flight Controller Engineering Framework Demo")
-    print("=" * 60)
+    # Show the framework's own output inline with the demo's
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
+    out = [
+        "🚁 Flight Controller Engineering Framework Demo",
+        "=" * 60,
+    ]
     
     # Use flight controller config
     config_path = "tools/example-flight-controller-config.json"
     
     try:
         framework = SystematicEngineeringFramework(config_path)
-        print("✅ Flight controller framework loaded successfully")
+        out.append("✅ Flight controller framework loaded successfully")
         
         # Show available generators
-        print("\\n💡 Available Flight Control Generators:")
+        out += ["", "💡 Available Flight Control Generators:"]
         generators = framework.get_available_generators()
         
-        config = framework.config
         for gen in generators:
-            gen_config = config["code_generators"][gen]
-            desc = gen_config.get("description", "No description")
-            safety = "🔒 SAFETY-CRITICAL" if gen_config.get("safety_critical") else "⚡ STANDARD"
-            print(f"  - {gen}: {desc} [{safety}]")
+            gen_config = framework.project.code_generators[gen]
+            desc = gen_config.description or "No description"
+            safety = "🔒 SAFETY-CRITICAL" if gen_config.safety_critical else "⚡ STANDARD"
+            out.append(f"  - {gen}: {desc} [{safety}]")
         
-        print("\\n🔧 Generating attitude controller module...")
-        print("-" * 50)
+        out += ["", "🔧 Generating attitude controller module...", "-" * 50]
+        flush_lines(out)  # The framework prints the module itself
         
         # Generate a flight control module
         result = framework.generate_module("attitude-controller")
         
         if result:
-            print("\\n✅ Successfully generated flight control module!")
-            print("\\n📊 Domain Comparison:")
-            print("  RumbleDome    → Boost pressure control")
-            print("  Flight Control → Aircraft attitude control")
-            print("  Same Framework → Different domains, same methodology")
+            out += [
+                "",
+                "✅ Successfully generated flight control module!",
+                "",
+                "📊 Domain Comparison:",
+                "  RumbleDome    → Boost pressure control",
+                "  Flight Control → Aircraft attitude control",
+                "  Same Framework → Different domains, same methodology",
+            ]
         
-        print("\\n🎯 Framework Validation:")
+        out += ["", "🎯 Framework Validation:"]
+        flush_lines(out)
         issues = framework.validate_all()
         
         if not issues:
-            print("✅ Flight controller project would have perfect health!")
+            out.append("✅ Flight controller project would have perfect health!")
         else:
-            print(f"⚠️ Found validation issues (expected for demo)")
+            out.append(f"⚠️ Found validation issues (expected for demo)")
     
     except Exception as e:
-        print(f"❌ Demo failed: {e}")
+        out.append(f"❌ Demo failed: {e}")
+        flush_lines(out)
         return 1
     
-    print("\\n" + "=" * 60)
-    print("🌟 Framework Portability Demonstrated!")
-    print("   Same core engine, different domains")
-    print("   Configuration-driven, not code-driven")
-    print("   Reusable across ANY engineering project")
+    out += [
+        "",
+        "=" * 60,
+        "🌟 Framework Portability Demonstrated!",
+        "   Same core engine, different domains",
+        "   Configuration-driven, not code-driven",
+        "   Reusable across ANY engineering project",
+    ]
+    flush_lines(out)
     
     return 0
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())